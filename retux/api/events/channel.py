@@ -7,28 +7,40 @@ from ...client.resources.misc import Timestamp
 class ChannelCreate(Channel):
     """Represents a `CHANNEL_CREATE` Gateway event from Discord."""
 
+    __slots__ = ()
+
 
 class ChannelUpdate(Channel):
     """Represents a `CHANNEL_UPDATE` Gateway event from Discord."""
 
+    __slots__ = ()
+
 
 class ChannelDelete(Channel):
     """Represents a `CHANNEL_DELETE` Gateway event from Discord."""
 
+    __slots__ = ()
+
 
 class ThreadCreate(ThreadChannel):
     """Represents a `THREAD_CREATE` Gateway event from Discord."""
 
+    __slots__ = ()
+
 
 class ThreadUpdate(ThreadChannel):
     """Represents a `THREAD_UPDATE` Gateway event from Discord."""
 
+    __slots__ = ()
+
 
 class ThreadDelete(ThreadChannel):
     """Represents a `THREAD_DELETE` Gateway event from Discord."""
 
+    __slots__ = ()
+
 
-@define(kw_only=True)
+@define(kw_only=True, eq=False, repr=False)
 class ThreadListSync:
     """
     Represents a `THREAD_LIST_SYNC` Gateway event from Discord.
@@ -45,8 +57,9 @@ class ThreadListSync:
     ----------
     guild_id : `int`
         The members inside of the threads given.
-    channel_ids : `list[int]`, optional
+    channel_ids : `tuple[int, ...]`, optional
         The members inside of the threads given.
+        Defaults to an empty tuple.
     threads : `list[ThreadChannel]`
         The members inside of the threads given.
     members : `list[ThreadMember]`
@@ -55,15 +68,18 @@ class ThreadListSync:
 
     guild_id: int
     """the id of the guild a thread was gained access to."""
-    channel_ids: list[int] = None
-    """the thread channel ids associated to the syncing call."""
+    channel_ids: tuple[int, ...] = ()
+    """
+    the thread channel ids associated to the syncing call.
+    Defaults to an empty tuple.
+    """
     threads: list[ThreadChannel]
     """the thread channels associated to the syncing call."""
     members: list[ThreadMember]
     """The members inside of the threads given."""
 
 
-@define(kw_only=True)
+@define(kw_only=True, eq=False)
 class ChannelPinsUpdate:
     """
     Represents a `CHANNEL_PINS_UPDATE` Gateway event from Discord.
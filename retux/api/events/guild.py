@@ -1,4 +1,5 @@
-from attrs import define
+from attrs import define, field
+from cattrs import structure
 
 from ...client.resources.channel import Channel, ThreadChannel
 from ...client.resources.emoji import Emoji
@@ -11,7 +12,7 @@ from ...client.resources.sticker import Sticker
 from ...client.resources.user import User
 
 
-@define(kw_only=True)
+@define(kw_only=True, repr=False)
 class GuildCreate(Guild):
     """
     Represents a `GUILD_CREATE` Gateway event from Discord.
@@ -50,8 +51,8 @@ class GuildCreate(Guild):
     # # TODO: Implement PartialVoiceState object.
     # # voice_states: list[PartialVoiceState]
     # # """The voice states of members in the guild."""
-    members: list[Member]
-    """The members of the guild."""
+    _members: list[dict]
+    """The raw members of the guild, as sent by Discord."""
     channels: list[Channel]
     """The channels of the guild."""
     threads: list[ThreadChannel]
@@ -63,11 +64,22 @@ class GuildCreate(Guild):
     """The stage instances of the guild."""
     guild_scheduled_events: list[GuildScheduledEvent]
     """The scheduled events of the guild."""
+    _members_list: list[Member] | None = field(default=None, init=False, eq=False, repr=False)
+    """The structured form of `members`, built on first access."""
+
+    @property
+    def members(self) -> list[Member]:
+        """The members of the guild."""
+        if self._members_list is None:
+            self._members_list = structure(self._members, list[Member])
+        return self._members_list
 
 
 class GuildUpdate(Guild):
     """Represents a `GUILD_UPDATE` Gateway event from Discord."""
 
+    __slots__ = ()
+
 
 class GuildDelete(UnavailableGuild):
     """
@@ -79,8 +91,10 @@ class GuildDelete(UnavailableGuild):
     being removed from the guild.
     """
 
+    __slots__ = ()
 
-@define(kw_only=True)
+
+@define(kw_only=True, eq=False)
 class GuildBanAdd:
     """
     Represents a `GUILD_BAN_ADD` Gateway event from Discord.
@@ -99,7 +113,7 @@ class GuildBanAdd:
     """The user who was banned from the guild."""
 
 
-@define(kw_only=True)
+@define(kw_only=True, eq=False)
 class GuildBanRemove:
     """
     Represents a `GUILD_BAN_REMOVE` Gateway event from Discord.
@@ -118,7 +132,7 @@ class GuildBanRemove:
     """The user who was unbanned from the guild."""
 
 
-@define(kw_only=True)
+@define(kw_only=True, eq=False)
 class GuildEmojisUpdate:
     """
     Represents a `GUILD_EMOJIS_UPDATE` Gateway event from Discord.
@@ -137,7 +151,7 @@ class GuildEmojisUpdate:
     """The emojis updated in the guild."""
 
 
-@define(kw_only=True)
+@define(kw_only=True, eq=False)
 class GuildStickersUpdate:
     """
     Represents a `GUILD_STICKERS_UPDATE` Gateway event from Discord.
@@ -156,7 +170,7 @@ class GuildStickersUpdate:
     """The stickers updated in the guild."""
 
 
-@define(kw_only=True)
+@define(kw_only=True, eq=False)
 class GuildIntegrationsUpdate:
     """
     Represents a `GUILD_INTEGRATIONS_UPDATE` Gateway event from Discord.
@@ -186,7 +200,7 @@ class GuildMemberAdd(Member):
     """The ID of the guild where a user was added."""
 
 
-@define(kw_only=True)
+@define(kw_only=True, eq=False)
 class GuildMemberRemove:
     """
     Represents a `GUILD_MEMBER_REMOVE` Gateway event from Discord.
@@ -205,7 +219,7 @@ class GuildMemberRemove:
     """The user who was removed from the guild."""
 
 
-@define(kw_only=True)
+@define(kw_only=True, eq=False)
 class GuildMemberUpdate:
     """
     Represents a `GUILD_MEMBER_UPDATE` Gateway event from Discord.
@@ -214,14 +228,14 @@ class GuildMemberUpdate:
     ----------
     guild_id : `int`
         The ID of the guild where the user was removed.
-    roles : `list[int]`
-        The roles belonging to the guild member.
     user : `User`
         The user who was removed from the guild.
+    roles : `list[int]`
+        The roles belonging to the guild member.
     nick : `str`, optional
         The nickname of the guild member, if present.
-    avatar : `Image`, optional
-        The avatar of the guild member, if present.
+    avatar : `str`, optional
+        The hash of the guild member's avatar, if present.
     joined_at : `Timestamp`
         The time at which the user joined the guild.
     premium_since : `Timestamp`, optional
@@ -239,18 +253,23 @@ class GuildMemberUpdate:
     communication_disabled_until : `Timestamp`, optional
         The time remaining before the member is no longer
         timed out, if present.
+
+    Methods
+    -------
+    avatar_image : `Image`, optional
+        The avatar of the guild member as an image, if present.
     """
 
     guild_id: int
     """The ID of the guild where the user was removed."""
-    roles: list[int]
-    """The roles belonging to the guild member."""
     user: User
     """The user who was removed from the guild."""
+    roles: list[int]
+    """The roles belonging to the guild member."""
     nick: str = None
     """The nickname of the guild member, if present."""
-    avatar: str | Image = None
-    """The avatar of the guild member, if present."""
+    avatar: str = None
+    """The hash of the guild member's avatar, if present."""
     joined_at: Timestamp = None
     """The time at which the user joined the guild."""
     premium_since: Timestamp = None
@@ -279,16 +298,22 @@ class GuildMemberUpdate:
     if present.
     """
 
-    def __attrs_post_init__(self):
-        # FIXME: This needs a more proper method of being built. Some design limitations
-        # are easy to see when put into practice.
-        if self.avatar is not None:
-            hash = self.avatar
-            self.avatar = Image._c(CDNEndpoint.GUILD_MEMBER_AVATAR)
-            self.avatar._vars = [self.guild_id, self.user.id, hash]
+    _avatar_image: Image | None = field(default=None, init=False, repr=False)
+    """The image form of `avatar`, built on first access."""
 
+    @property
+    def avatar_image(self) -> Image | None:
+        """The avatar of the guild member as an image, if present."""
+        if self.avatar is not None and self._avatar_image is None:
+            self._avatar_image = Image(
+                hash=self.avatar,
+                endpoint=CDNEndpoint.GUILD_MEMBER_AVATAR,
+                ids=[self.guild_id, self.user.id],
+            )
+        return self._avatar_image
 
-@define(kw_only=True)
+
+@define(kw_only=True, eq=False, repr=False)
 class GuildMembersChunk:
     """
     Represents a `GUILD_MEMBERS_CHUNK` Gateway event from Discord.
@@ -310,29 +335,42 @@ class GuildMembersChunk:
         The current chunk index of the guild.
     chunk_count : `int`
         The amount of chunks sent to the guild.
-    not_found : `list`, optional
+    not_found : `tuple`, optional
         IDs that were not found in the request, if present.
+        Defaults to an empty tuple.
     nonce : `str`, optional
         The nonce of the requested guild.
     """
 
     guild_id: int
     """The ID of the guild where the request was performed."""
-    members: list[Member]
-    """The returned members of the guild."""
+    _members: list[dict]
+    """The raw returned members of the guild, as sent by Discord."""
     chunk_index: int
     """The current chunk index of the guild."""
     chunk_count: int
     """The amount of chunks sent to the guild."""
-    not_found: list = None
-    """IDs that were not found in the request, if present."""
+    not_found: tuple = ()
+    """
+    IDs that were not found in the request, if present.
+    Defaults to an empty tuple.
+    """
     # TODO: Implement Presence object.
     # presences: list[Presence] = None
     nonce: str = None
     """The nonce of the requested guild."""
+    _members_list: list[Member] | None = field(default=None, init=False, eq=False, repr=False)
+    """The structured form of `members`, built on first access."""
 
+    @property
+    def members(self) -> list[Member]:
+        """The returned members of the guild."""
+        if self._members_list is None:
+            self._members_list = structure(self._members, list[Member])
+        return self._members_list
 
-@define(kw_only=True)
+
+@define(kw_only=True, eq=False)
 class GuildRoleCreate:
     """
     Represents a `GUILD_ROLE_CREATE` Gateway event from Discord.
@@ -351,7 +389,7 @@ class GuildRoleCreate:
     """The role that was added to the guild."""
 
 
-@define(kw_only=True)
+@define(kw_only=True, eq=False)
 class GuildRoleUpdate:
     """
     Represents a `GUILD_ROLE_UPDATE` Gateway event from Discord.
@@ -370,7 +408,7 @@ class GuildRoleUpdate:
     """The role that was added to the guild."""
 
 
-@define(kw_only=True)
+@define(kw_only=True, eq=False)
 class GuildRoleDelete:
     """
     Represents a `GUILD_ROLE_DELETE` Gateway event from Discord.
@@ -392,16 +430,22 @@ class GuildRoleDelete:
 class GuildScheduledEventCreate(GuildScheduledEvent):
     """Represents a `GUILD_SCHEDULED_EVENT_CREATE` Gateway event from Discord."""
 
+    __slots__ = ()
+
 
 class GuildScheduledEventUpdate(GuildScheduledEvent):
     """Represents a `GUILD_SCHEDULED_EVENT_UPDATE` Gateway event from Discord."""
 
+    __slots__ = ()
+
 
 class GuildScheduledEventDelete(GuildScheduledEvent):
     """Represents a `GUILD_SCHEDULED_EVENT_DELETE` Gateway event from Discord."""
 
+    __slots__ = ()
 
-@define(kw_only=True)
+
+@define(kw_only=True, eq=False)
 class GuildScheduledEventUserAdd:
     """
     Represents a `GUILD_SCHEDULED_EVENT_USER_ADD` Gateway event from Discord.
@@ -424,7 +468,7 @@ class GuildScheduledEventUserAdd:
     """The ID of the guild associated to the scheduled event."""
 
 
-@define(kw_only=True)
+@define(kw_only=True, eq=False)
 class GuildScheduledEventUserRemove:
     """
     Represents a `GUILD_SCHEDULED_EVENT_USER_REMOVE` Gateway event from Discord.
@@ -1,3 +1,7 @@
+from sys import intern
+
+from ...const import MISSING, NotNeeded
+
 from .channel import (
     ChannelCreate,
     ChannelDelete,
@@ -82,3 +86,60 @@ class EventType:
     THREAD_UPDATE = ThreadUpdate
     THREAD_DELETE = ThreadDelete
     THREAD_LIST_SYNC = ThreadListSync
+
+    @staticmethod
+    def lookup(name: str) -> NotNeeded[type]:
+        """
+        Looks up the dataclass of a Gateway event by its name.
+        This is the same lookup as `lookup_event()`.
+
+        Parameters
+        ----------
+        name : `str`
+            The name of the Gateway event, e.g. `GUILD_CREATE`.
+
+        Returns
+        -------
+        `type`, `MISSING`
+            The event dataclass, or `MISSING` if none exists for the name.
+        """
+        return lookup_event(name)
+
+
+_EVENT_TABLE: dict[str, type] = {
+    intern(key): value for key, value in vars(EventType).items() if key.isupper()
+}
+"""
+A pre-merged table of every event name to its dataclass.
+This is what the Gateway reads from when dispatching.
+"""
+
+_EVENT_NAMES: dict[str, str] = {key: intern(key.lower()) for key in _EVENT_TABLE}
+"""
+The lowercased form of every event name, which is what
+bots register their callbacks under.
+"""
+
+
+def lookup_event(name: str, _get=_EVENT_TABLE.get) -> NotNeeded[type]:
+    """
+    Looks up the dataclass of a Gateway event by its name.
+
+    ---
+
+    The table's `get` is bound as a default argument so the
+    lookup stays a local load on the dispatch path.
+
+    ---
+
+    Parameters
+    ----------
+    name : `str`
+        The name of the Gateway event, e.g. `GUILD_CREATE`.
+
+    Returns
+    -------
+    `type`, `MISSING`
+        The event dataclass, or `MISSING` if none exists for the name.
+    """
+    return _get(name, MISSING)
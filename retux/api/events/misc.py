@@ -5,7 +5,7 @@ from attrs import define, field
 from ...client.resources.guild import Member
 
 
-@define(kw_only=True)
+@define(kw_only=True, eq=False)
 class TypingStart:
     """
     Represents a `TYPING_START` Gateway event from Discord.
@@ -34,8 +34,8 @@ class TypingStart:
     """The ID of the channel when typing occured."""
     user_id: int
     """The ID of the user who started typing."""
-    timestamp: datetime = field(converter=datetime.fromtimestamp)
-    """The timestamp of when the typing occured."""
+    _timestamp: int
+    """The UNIX timestamp of when the typing occured."""
     guild_id: int | None = None
     """
     The ID of the guild when typing occured.
@@ -50,3 +50,12 @@ class TypingStart:
     This will only appear when a user is typing
     outside of a DM.
     """
+    _timestamp_dt: datetime | None = field(default=None, init=False, repr=False)
+    """The parsed form of `timestamp`, filled on first access."""
+
+    @property
+    def timestamp(self) -> datetime:
+        """The timestamp of when the typing occured."""
+        if self._timestamp_dt is None:
+            self._timestamp_dt = datetime.fromtimestamp(self._timestamp)
+        return self._timestamp_dt
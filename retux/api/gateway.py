@@ -1,15 +1,20 @@
 from enum import IntEnum
-from json import dumps, loads
-from logging import getLogger
+from logging import DEBUG, getLogger
 from random import random
-from sys import platform
+from sys import intern, platform
 from time import perf_counter
 from typing import Any
 
-import cattrs
-from attrs import asdict, define, field
+from attrs import define, field
 from cattrs import structure
-from trio import open_nursery, sleep
+from trio import (
+    ClosedResourceError,
+    MemoryReceiveChannel,
+    MemorySendChannel,
+    open_memory_channel,
+    open_nursery,
+    sleep,
+)
 from trio._core._run import NurseryManager
 from trio_websocket import ConnectionClosed, WebSocketConnection, open_websocket_url
 
@@ -24,7 +29,18 @@ from .error import (
     RateLimited,
     RequiresSharding,
 )
-from .events.lookup import EventType
+from .events.lookup import _EVENT_NAMES, lookup_event
+
+try:
+    from orjson import dumps as _dumps, loads
+
+    def dumps(obj: Any) -> str:
+        # orjson encodes straight to bytes. Discord expects JSON payloads
+        # as text frames, so they're decoded before sending.
+        return _dumps(obj).decode()
+
+except ImportError:
+    from json import dumps, loads
 
 logger = getLogger(__name__)
 
@@ -79,46 +95,26 @@ class _GatewayOpCode(IntEnum):
     """An event received to acknowledge a `HEARTBEAT` sent."""
 
 
-@define(slots=False)
-class _GatewayPayload:
-    """
-    Represents a Gateway payload, signifying data for events.
-
-    The `s` (`sequence`) and `t` (`name`) attributes will only have
-    a value when:
-
-    - `op` (`opcode`) is `DISPATCH`.
-    - A `RESUME` call has been made. (specific to the former)
-    """
-
-    op: int | _GatewayOpCode = field(converter=int)
-    """The opcode of the payload."""
-    d: Any | None = None
-    """The payload's event data."""
-    s: int | None = None
-    """The sequence number, used for resuming sessions and heartbeats."""
-    t: str | None = None
-    """The name of the payload's event."""
-
-    @property
-    def opcode(self) -> int:
-        """The opcode of the payload."""
-        return self.op
-
-    @property
-    def data(self) -> Any | None:
-        """The payload's event data"""
-        return self.d
-
-    @property
-    def sequence(self) -> int | None:
-        """The sequence number, used for resuming sessions and heartbeats."""
-        return self.s
-
-    @property
-    def name(self) -> str | None:
-        """The name of the payload's event."""
-        return self.t
+_FATAL_CLOSE_CODES: dict[int, tuple[type[Exception], str]] = {
+    4004: (
+        InvalidToken,
+        "Your bots token is invalid. (Make sure there's a value, or reset if needed.)",
+    ),
+    4010: (
+        InvalidShard,
+        "You provided an invalid shard. Make sure the shard is correct! (https://discord.dev/topics/gateway#sharding)",
+    ),
+    4011: (RequiresSharding, "Your bot requires sharding, please use autoshard=True."),
+    4013: (
+        InvalidIntents,
+        "You provided an invalid intent. Make sure your intent is a value! (Did you also miss a | for adding more than one?)",
+    ),
+    4014: (
+        DisallowedIntents,
+        "You provided an intent that your bot is not approved for. Make sure your bot is verified and/or has it enabled in the Developer Portal.",
+    ),
+}
+"""The closing codes we can't reconnect from, and the error raised for each."""
 
 
 class GatewayClient:
@@ -142,18 +138,26 @@ class GatewayClient:
         The intents to connect with.
     _conn : `trio_websocket.WebSocketConnection`
         An instance of a connection to the Gateway.
+    _url : `str`, optional
+        The URL last used to connect to the Gateway.
     _meta : `_GatewayMeta`
         Metadata representing connection parameters for the Gateway.
     _tasks : `trio.Nursery`
         The tasks associated with the Gateway, for reconnection and heart-beating.
+    _outgoing : `trio.MemorySendChannel`
+        The queue of encoded payloads waiting to be sent to the Gateway.
     _closed : `bool`
         Whether the Gateway connection is closed or not.
     _stopped : `bool`
         Whether the Gateway connection was forcefully stopped or not.
     _heartbeat_ack : `bool`
         Whether we've received the first heartbeat acknowledgement or not.
-    _last_ack : `list[float]`
-        The before/after time of the last Gateway event tracked. See `latency` for Gateway connection timing.
+    _last_ack_before : `float`
+        The time the last Gateway event finished being tracked. See `latency` for Gateway connection timing.
+    _last_ack_after : `float`
+        The time the last Gateway event was received. See `latency` for Gateway connection timing.
+    _heartbeat_cache : `tuple[int | None, str]`, optional
+        The last sequence number heart-beaten with, and its encoded payload.
     _bots : `list[retux.Bot]`
         The bot instances used for dispatching events.
     """
@@ -165,12 +169,16 @@ class GatewayClient:
         "intents",
         "_meta",
         "_tasks",
+        "_outgoing",
         "_closed",
         "_stopped",
         "_heartbeat_ack",
-        "_last_ack",
+        "_last_ack_before",
+        "_last_ack_after",
+        "_heartbeat_cache",
         "_bots",
         "_conn",
+        "_url",
     )
     token: str
     """The bots token."""
@@ -180,16 +188,24 @@ class GatewayClient:
     """Metadata representing connection parameters for the Gateway."""
     _conn: WebSocketConnection | None
     """An instance of a connection to the Gateway."""
+    _url: str | None
+    """The URL last used to connect to the Gateway."""
     _tasks: NurseryManager | None
     """The tasks associated with the Gateway, for reconnection and heart-beating."""
+    _outgoing: MemorySendChannel | None
+    """The queue of encoded payloads waiting to be sent to the Gateway."""
     _closed: bool
     """Whether the Gateway connection is closed or not."""
     _stopped: bool
     """Whether the Gateway connection was forcefully stopped or not."""
     _heartbeat_ack: bool
     """Whether we've received the first heartbeat acknowledgement or not."""
-    _last_ack: list[float]
-    """The before/after time of the last Gateway event tracked. See `latency` for Gateway connection timing."""
+    _last_ack_before: float
+    """The time the last Gateway event finished being tracked. See `latency` for Gateway connection timing."""
+    _last_ack_after: float
+    """The time the last Gateway event was received. See `latency` for Gateway connection timing."""
+    _heartbeat_cache: tuple[int | None, str] | None
+    """The last sequence number heart-beaten with, and its encoded payload."""
     _bots: list["Bot"]  # noqa
     """The bot instances used for dispatching events."""
 
@@ -225,21 +241,30 @@ class GatewayClient:
         )
 
         self._conn = None
+        self._url = None
         self._tasks = None
+        self._outgoing = None
         self._closed = True
         self._stopped = False
         self._heartbeat_ack = False
-        self._last_ack = []
+        self._last_ack_before = 0.0
+        self._last_ack_after = 0.0
+        self._heartbeat_cache = None
         self._bots = []
 
     async def __aenter__(self):
         self._tasks = open_nursery()
         nursery = await self._tasks.__aenter__()  # noqa
+        self._outgoing, outgoing = open_memory_channel(64)
+        nursery.start_soon(self._writer, outgoing)
         nursery.start_soon(self.reconnect)
         nursery.start_soon(self._heartbeat)
         return self
 
     async def __aexit__(self, *exc):
+        # The writer only finishes once the queue is closed, and the
+        # nursery can't exit until it does.
+        await self._outgoing.aclose()
         return await self._tasks.__aexit__(*exc)  # noqa
 
     def create_task(self, async_fn, *args, **kwargs):
@@ -248,14 +273,24 @@ class GatewayClient:
 
         self._tasks._nursery.start_soon(wrapper)
 
-    async def _receive(self) -> _GatewayPayload:
+    async def _receive(self) -> dict:
         """
         Receives the next incoming payload from the Gateway.
 
+        ---
+
+        The `s` (sequence) and `t` (name) keys will only have
+        a value when:
+
+        - `op` (opcode) is `DISPATCH`.
+        - A `RESUME` call has been made. (specific to the former)
+
+        ---
+
         Returns
         -------
-        `_GatewayPayload`
-            A class of the payload data.
+        `dict`
+            The decoded payload data.
         """
 
         # FIXME: our exception handling neglects other rejection
@@ -265,19 +300,25 @@ class GatewayClient:
 
         try:
             resp = await self._conn.get_message()
-            json = loads(resp)
-            return structure(json, _GatewayPayload)
+            return loads(resp)
         except ConnectionClosed:
             logger.error("The connection to Discord's Gateway has closed.")
             await self._error()
 
-    async def _send(self, payload: _GatewayPayload):
+    async def _send(self, payload: dict):
         """
         Sends a payload to the Gateway.
 
+        ---
+
+        Outgoing payloads are written as plain dictionaries of
+        `op` and `d`, the same shape they're received in.
+
+        ---
+
         Parameters
         ----------
-        payload : `_GatewayPayload`
+        payload : `dict`
             The payload to send.
         """
 
@@ -285,27 +326,77 @@ class GatewayClient:
         # the theory of this is to "queue" dispatched information
         # from the Gateway when we enter a rate limit.
 
+        await self._send_raw(dumps(payload))
+
+    async def _send_raw(self, json: str):
+        """
+        Queues an already encoded payload to be sent to the Gateway.
+
+        Parameters
+        ----------
+        json : `str`
+            The encoded payload to send.
+        """
         try:
-            json = dumps(asdict(payload))
-            resp = await self._conn.send_message(json)  # noqa
-        except ConnectionClosed:
-            logger.error("The connection to Discord's Gateway has closed.")
-            await self._error()
+            await self._outgoing.send(json)
+        except ClosedResourceError:
+            logger.debug("Dropped a Gateway payload queued after the client stopped.")
+
+    async def _writer(self, outgoing: MemoryReceiveChannel):
+        """
+        Sends queued payloads to the Gateway as they come in.
+
+        ---
+
+        Discord only accepts one command per frame, so payloads
+        are still sent one at a time. Queueing them lets callers
+        carry on without waiting on the connection.
+
+        Payloads that can't be sent because there's no open
+        connection are dropped with a warning. The session itself
+        is unaffected, as `IDENTIFY` or `RESUME` is sent again on
+        the `HELLO` of every new connection.
+
+        ---
+
+        Parameters
+        ----------
+        outgoing : `trio.MemoryReceiveChannel`
+            The receiving end of the outgoing payload queue.
+        """
+        async with outgoing:
+            async for json in outgoing:
+                if self._conn is None or self._closed:
+                    logger.warning("Dropped a Gateway payload sent while disconnected.")
+                    continue
+
+                try:
+                    await self._conn.send_message(json)
+                except ConnectionClosed:
+                    # The receiving loop sees the same closure and handles
+                    # reconnecting. Doing it here would stall the queue.
+                    logger.error("The connection to Discord's Gateway has closed.")
+                    logger.warning("Dropped a Gateway payload sent while disconnected.")
 
     async def connect(self):
         """Connects to the Gateway and initiates a WebSocket state."""
         self._stopped = False
-        self._last_ack = [perf_counter(), perf_counter()]
+        self._last_ack_before = self._last_ack_after = perf_counter()
 
         # FIXME: this connection type will only work with JSON in mind.
         # if other compression or encoding types are supplied, they
         # will not be properly digested. This is only added so others
         # may modify their GatewayClient to their liking.
 
-        async with open_websocket_url(
-            f"{self._meta.resume_gateway_url or __gateway_url__}?v={self._meta.version}&encoding={self._meta.encoding}"
-            f"{'' if self._meta.compress is None else f'&compress={self._meta.compress}'}"
-        ) as self._conn:
+        # The URL only changes when Discord gives us a new resume URL,
+        # which clears this so it's rebuilt on the next connection.
+        if self._url is None:
+            self._url = (
+                f"{self._meta.resume_gateway_url or __gateway_url__}?v={self._meta.version}&encoding={self._meta.encoding}"
+                f"{'' if self._meta.compress is None else f'&compress={self._meta.compress}'}"
+            )
+
+        async with open_websocket_url(self._url) as self._conn:
             self._closed = bool(self._conn.closed)
 
             if self._stopped:
@@ -332,10 +423,19 @@ class GatewayClient:
 
     async def _error(self):
         """Handles error responses from closing codes."""
-        code = self._conn.closed.code if self._conn.closed is not None else 4999
-        reason = self._conn.closed.reason if self._conn.closed is not None else "N/A"
+        closed = self._conn.closed
+        code = closed.code if closed is not None else 4999
+        reason = closed.reason if closed is not None else "N/A"
         await self._conn.aclose()
 
+        if code in _FATAL_CLOSE_CODES or (code == 1000 and self._stopped):
+            # Nothing will be sent again, so the writer is let go.
+            await self._outgoing.aclose()
+
+        if code in _FATAL_CLOSE_CODES:
+            error, message = _FATAL_CLOSE_CODES[code]
+            raise error(message)
+
         match code:
             case 1000:
                 # This is a normal closure. We should never try reconnecting it, but random edge cases
@@ -358,10 +458,6 @@ class GatewayClient:
                     "Something went wrong with the Gateway. We'll reconnect.",
                 )
                 await self.reconnect()
-            case 4004:
-                raise InvalidToken(
-                    "Your bots token is invalid. (Make sure there's a value, or reset if needed.)"
-                )
             case 4008:
                 # Theory-wise, the user won't need to know about the rate limit if we're handling it already.
                 # We only throw non-resumable exceptions for things that cannot resume the connection.
@@ -371,20 +467,6 @@ class GatewayClient:
                     "Your bot is being Gateway rate limited. You will be reconnected.",
                 )
                 await self.reconnect()
-            case 4010:
-                raise InvalidShard(
-                    "You provided an invalid shard. Make sure the shard is correct! (https://discord.dev/topics/gateway#sharding)"
-                )
-            case 4011:
-                raise RequiresSharding("Your bot requires sharding, please use autoshard=True.")
-            case 4013:
-                raise InvalidIntents(
-                    "You provided an invalid intent. Make sure your intent is a value! (Did you also miss a | for adding more than one?)"
-                )
-            case 4014:
-                raise DisallowedIntents(
-                    "You provided an intent that your bot is not approved for. Make sure your bot is verified and/or has it enabled in the Developer Portal."
-                )
             case 4999:
                 logger.exception(
                     RandomClose,
@@ -394,79 +476,117 @@ class GatewayClient:
             case _:
                 raise RandomClose(f"The Gateway randomly closed. {reason}#{code}")
 
-    async def _track(self, payload: _GatewayPayload):
+    async def _track(self, payload: dict):
         """
         Tracks data sent from the Gateway and interprets it.
 
         Parameters
         ----------
-        payload : `_GatewayPayload`
-            The payload being sent from the Gateway.
+        payload : `dict`
+            The decoded payload being sent from the Gateway.
         """
-        logger.debug(f"Tracking {_GatewayOpCode(payload.opcode).name}.")
+        op = payload["op"]
+
+        if logger.isEnabledFor(DEBUG):
+            logger.debug("Tracking %s.", _GatewayOpCode(op).name)
         # Discord recommends to always use the last given sequence for reconnects.
         # This helps with resending payloads that were lost on a disconnect.
-        self._meta.seq = payload.sequence
-        self._last_ack[1] = perf_counter()
-
-        match _GatewayOpCode(payload.opcode):
-            case _GatewayOpCode.HELLO:
-                if self._meta.session_id and self._meta.resume_gateway_url:
-                    await self._resume()
-                else:
-                    await self._identify()
-                    self._meta.heartbeat_interval = payload.data["heartbeat_interval"] / 1000
-                    logger.debug(f"❤ -> {self._meta.heartbeat_interval}ms.")
-                    self._heartbeat_ack = True
-            case _GatewayOpCode.HEARTBEAT_ACK:
-                logger.debug(f"❤️ ({self.latency}ms.)")
-            case _GatewayOpCode.INVALID_SESSION:
-                logger.info("Our Gateway connection has suddenly invalidated.")
-
-                if bool(payload.data):
-                    self._heartbeat_ack = False
-                    await self._resume()
-                else:
-                    self._meta.session_id = None
-                    await self._conn.aclose()
-                    await self.reconnect()
-            case _GatewayOpCode.RECONNECT:
-                self._heartbeat_ack = False
-                await self._resume()
-            case _GatewayOpCode.DISPATCH:
-                if payload.name not in ["RESUMED", "READY"]:
-                    resource = EventType.__dict__.get(payload.name, MISSING)
-                    if resource is not MISSING:
-                        await self._dispatch(
-                            payload.name,
-                            cattrs.structure(payload.data, resource),
-                            # **payload.data
-                        )
-                    else:
-                        await self._dispatch(payload.name, payload.data)
-                    await self._dispatch(
-                        "RAW_RECEIVE",
-                        {
-                            **payload.data,
-                            "_event_type": resource,
-                            "_event_name": payload.name,
-                        },
-                    )
-        match payload.name:
+        self._meta.seq = payload.get("s")
+        self._last_ack_after = perf_counter()
+
+        # IntEnum members hash the same as the raw opcode, so there's
+        # no need to build the enum member just to look its handler up.
+        handler = self._OP_HANDLERS.get(op)
+        if handler is not None:
+            await handler(self, payload.get("d"), payload.get("t"))
+        self._last_ack_before = perf_counter()
+
+    async def _track_dispatch(self, data: dict, name: str):
+        """Tracks a `DISPATCH`, passing the event on to any hooked bots."""
+        # Event names are decoded as new strings on every frame. Interning
+        # them lets the lookups below compare keys by identity.
+        name = intern(name)
+
+        match name:
             case "RESUMED":
                 logger.info(
-                    f"Resumed connection. (session: {self._meta.session_id}, sequence: {self._meta.seq})"
+                    "Resumed connection. (session: %s, sequence: %s)",
+                    self._meta.session_id,
+                    self._meta.seq,
                 )
                 self._heartbeat_ack = True
             case "READY":
-                self._meta.session_id = payload.data["session_id"]
-                self._meta.seq = payload.sequence
-                self._meta.resume_gateway_url = payload.data["resume_gateway_url"]
+                self._meta.session_id = data["session_id"]
+                self._meta.resume_gateway_url = data["resume_gateway_url"]
+                self._url = None
                 logger.info(
-                    f"Connection is now ready. (session: {self._meta.session_id}, sequence: {self._meta.seq})"
+                    "Connection is now ready. (session: %s, sequence: %s)",
+                    self._meta.session_id,
+                    self._meta.seq,
                 )
                 await self._dispatch("ready")
-        self._last_ack[0] = perf_counter()
+            # There's no use structuring an event nobody is hooked to receive.
+            case _ if self._bots:
+                resource = lookup_event(name)
+                if resource is not MISSING:
+                    await self._dispatch(
+                        name,
+                        structure(data, resource),
+                        # **data
+                    )
+                else:
+                    await self._dispatch(name, data)
+                # Merging a copy of the raw data is only worth it when
+                # someone is actually going to receive it.
+                if self._listening("raw_receive"):
+                    await self._dispatch(
+                        "RAW_RECEIVE",
+                        {
+                            **data,
+                            "_event_type": resource,
+                            "_event_name": name,
+                        },
+                    )
+
+    async def _track_hello(self, data: dict, name: str | None):
+        """Tracks a `HELLO`, starting or resuming the session."""
+        if self._meta.session_id and self._meta.resume_gateway_url:
+            await self._resume()
+        else:
+            await self._identify()
+            self._meta.heartbeat_interval = data["heartbeat_interval"] / 1000
+            logger.debug("❤ -> %sms.", self._meta.heartbeat_interval)
+            self._heartbeat_ack = True
+
+    async def _track_heartbeat_ack(self, data: Any, name: str | None):
+        """Tracks a `HEARTBEAT_ACK`."""
+        logger.debug("❤️ (%sms.)", self.latency)
+
+    async def _track_invalid_session(self, data: bool, name: str | None):
+        """Tracks an `INVALID_SESSION`, resuming if Discord allows it."""
+        logger.info("Our Gateway connection has suddenly invalidated.")
+
+        if data:
+            self._heartbeat_ack = False
+            await self._resume()
+        else:
+            self._meta.session_id = None
+            await self._conn.aclose()
+            await self.reconnect()
+
+    async def _track_reconnect(self, data: Any, name: str | None):
+        """Tracks a `RECONNECT`, resuming the session."""
+        self._heartbeat_ack = False
+        await self._resume()
+
+    _OP_HANDLERS = {
+        _GatewayOpCode.DISPATCH: _track_dispatch,
+        _GatewayOpCode.HELLO: _track_hello,
+        _GatewayOpCode.HEARTBEAT_ACK: _track_heartbeat_ack,
+        _GatewayOpCode.INVALID_SESSION: _track_invalid_session,
+        _GatewayOpCode.RECONNECT: _track_reconnect,
+    }
+    """The handlers `_track` uses for each opcode received from the Gateway."""
 
     async def _hook(self, bot: "Bot") -> object:  # noqa
         """
@@ -490,6 +610,29 @@ class GatewayClient:
         """
         self._bots.append(bot)
 
+    def _listening(self, name: str) -> bool:
+        """
+        Checks whether any hooked bot has a callback for an event.
+
+        ---
+
+        This is checked on every call rather than cached, as
+        callbacks may be registered at any point after hooking.
+
+        ---
+
+        Parameters
+        ----------
+        name : `str`
+            The lowercased name of the event.
+
+        Returns
+        -------
+        `bool`
+            Whether any bot is listening for the event.
+        """
+        return any(bot._calls.get(name) for bot in self._bots)
+
     async def _dispatch(
         self,
         _name: str,
@@ -519,54 +662,72 @@ class GatewayClient:
         data : `dict`, `Serializable`, `MISSING`
             The supplied payload data from the event.
         """
-        logger.debug(f"{_name}: {data}")
+        if not self._bots:
+            return
+
+        logger.debug("%s: %s", _name, data)
 
         # TODO: move the underlying dispatch logic to the ._track() method.
         # We probably don't need to segregate the callback designator flow here,
         # and may prove more beneficial if we handle it directly right next to the
         # event table lookup call, to avoid O(n) + 1 time complexity.
 
+        name = _EVENT_NAMES.get(_name) or _name.lower()
+
         for bot in self._bots:
+            # Most events have no callbacks on a given bot, and spawning
+            # a task just for it to find nothing is the costly part.
+            if not bot._calls.get(name):
+                continue
+
             if data is not MISSING:
-                self.create_task(bot._trigger, _name.lower(), data)
+                self.create_task(bot._trigger, name, data)
             else:
-                self.create_task(bot._trigger, _name.lower())
+                self.create_task(bot._trigger, name)
 
     async def _identify(self):
         """Sends an identification payload to the Gateway."""
-        payload = _GatewayPayload(
-            op=_GatewayOpCode.IDENTIFY.value,
-            d={
+        payload = {
+            "op": _GatewayOpCode.IDENTIFY.value,
+            "d": {
                 "token": self.token,
                 "intents": self.intents.value,
                 "properties": {"os": platform, "browser": "retux", "device": "retux"},
             },
-        )
+        }
         logger.debug("Sending identification.")
         await self._send(payload)
 
     async def _resume(self):
         """Sends a resuming payload to the Gateway."""
-        payload = _GatewayPayload(
-            op=_GatewayOpCode.RESUME,
-            d={
+        payload = {
+            "op": _GatewayOpCode.RESUME.value,
+            "d": {
                 "token": self.token,
                 "session_id": self._meta.session_id,
                 "seq": self._meta.seq,
             },
-        )
+        }
         logger.debug("Resuming connection call.")
         await self._send(payload)
 
     async def _heartbeat(self):
         """Sends a heartbeat payload to the Gateway."""
-        payload = _GatewayPayload(op=_GatewayOpCode.HEARTBEAT, d=self._meta.seq)
-
         await sleep(random())
 
         while self._heartbeat_ack:
             logger.debug("❤")
-            await self._send(payload)
+
+            # The payload only changes with the sequence, so it's
+            # encoded again only when a new sequence has come in.
+            seq = self._meta.seq
+            if self._heartbeat_cache is None or self._heartbeat_cache[0] != seq:
+                self._heartbeat_cache = (
+                    seq,
+                    dumps({"op": _GatewayOpCode.HEARTBEAT.value, "d": seq}),
+                )
+
+            await self._send_raw(self._heartbeat_cache[1])
             await sleep(self._meta.heartbeat_interval)
 
     async def request_guild_members(
@@ -606,24 +767,21 @@ class GatewayClient:
             A nonce used for identification when receiving a
             `Guild Members Chunk` event.
         """
-        payload = _GatewayPayload(
-            op=_GatewayOpCode.REQUEST_GUILD_MEMBERS,
-            d={
-                "guild_id": guild_id,
-                "query": "" if query is MISSING else query,
-                "limit": 0 if limit is MISSING else limit,
-            },
-        )
+        data = {
+            "guild_id": guild_id,
+            "query": "" if query is MISSING else query,
+            "limit": 0 if limit is MISSING else limit,
+        }
 
         if presences is not MISSING:
-            payload.data["presences"] = presences
+            data["presences"] = presences
         if user_ids is not MISSING:
-            payload.data["user_ids"] = user_ids
+            data["user_ids"] = user_ids
         if nonce is not MISSING:
-            payload.data["nonce"] = nonce
+            data["nonce"] = nonce
 
         logger.debug("Requesting for guild members.")
-        await self._send(payload)
+        await self._send({"op": _GatewayOpCode.REQUEST_GUILD_MEMBERS.value, "d": data})
 
     async def update_voice_state(
         self,
@@ -650,15 +808,15 @@ class GatewayClient:
             Whether the bot is deafening itself or not.
             Defaults to `False`.
         """
-        payload = _GatewayPayload(
-            op=_GatewayOpCode.VOICE_STATE_UPDATE,
-            d={
+        payload = {
+            "op": _GatewayOpCode.VOICE_STATE_UPDATE.value,
+            "d": {
                 "guild_id": guild_id,
                 "channel_id": None if channel_id is MISSING else channel_id,
                 "self_mute": False if self_mute is MISSING else self_mute,
                 "self_deaf": False if self_deaf is MISSING else self_deaf,
             },
-        )
+        }
         logger.debug("Requesting for a voice state update.")
         await self._send(payload)
 
@@ -683,15 +841,15 @@ class GatewayClient:
             allowing `since`, a client-determined variable. You may
             use this instead of writing "idle" to `status`.
         """
-        payload = _GatewayPayload(
-            op=_GatewayOpCode.PRESENCE_UPDATE,
-            d={
+        payload = {
+            "op": _GatewayOpCode.PRESENCE_UPDATE.value,
+            "d": {
                 "since": 0,
                 # "activities": asdict(activities),
                 "status": "online" if status is MISSING else status,
                 "afk": False if afk is MISSING and status != "idle" else afk,
             },
-        )
+        }
         logger.debug("Requesting for a presence update.")
         await self._send(payload)
 
@@ -701,4 +859,4 @@ class GatewayClient:
         The calculated difference between the last known set
         of acknowledgements for a Gateway event.
         """
-        return self._last_ack[1] - self._last_ack[0]
+        return self._last_ack_after - self._last_ack_before
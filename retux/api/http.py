@@ -218,7 +218,7 @@ class HTTPClient:
                         )
 
                     json = resp.json()
-                    logger.debug(f"{route.method} {route}: {resp.status_code}")
+                    logger.debug("%s %s: %s", route.method, route, resp.status_code)
                     logger.debug(dumps(loads(json), indent=4, sort_keys=True))
 
                     if isinstance(json, dict) and json.get("errors"):
@@ -1,15 +0,0 @@
-from .abc import *  # noqa
-from .app_commands import *  # noqa
-from .channel import *  # noqa
-from .components import *  # noqa
-from .guild_scheduled_event import *  # noqa
-from .intents import *  # noqa
-from .invite import *  # noqa
-from .misc import *  # noqa
-from .mixins import *  # noqa
-from .role import *  # noqa
-from .user import *  # noqa
-from .webhook import *  # noqa
-
-# Resource modules to be added when all dependencies are added as well:
-# from .application import * # noqa
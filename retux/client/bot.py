@@ -1,9 +1,12 @@
+from collections import defaultdict
+from functools import partial
 from logging import getLogger
+from sys import intern
 from typing import Any, Callable, Optional, overload, TypeVar
 
-from trio import run
+from trio import open_nursery, run
 
-from .models.event import Event
+from .models.event import Event, EventMeta
 from .models.listener import Listener
 from ..api import GatewayClient
 from ..api.http import HTTPClient
@@ -12,7 +15,6 @@ from ..utils.hooks import cattrs_structure_hooks
 from .flags import Intents
 
 logger = getLogger(__name__)
-logger.warning("retux is in alpha. If you come across a bug, please file a GitHub Issue.")
 
 _T = TypeVar("_T")
 EventSubclass = TypeVar("EventSubclass", bound=Event)
@@ -30,7 +32,7 @@ class Bot:
         The bot's gateway connection.
     http : `HTTPClient`
         The bot's HTTP connection.
-    _calls : `dict[str, list[Coro]]`
+    _calls : `defaultdict[str, list[Listener]]`
         A set of callbacks registered by their name to their function.
         These are used to help dispatch Gateway events.
     """
@@ -41,18 +43,31 @@ class Bot:
     """The bot's gateway connection."""
     http: HTTPClient
     """The bot's HTTP connection."""
-    _calls: dict[str, list[Listener]] = {}
+    _calls: defaultdict[str, list[Listener]]
     """
     A set of callbacks registered by their name to their function.
     These are used to help dispatch Gateway events.
     """
+    _alpha_warned: bool = False
+    """Whether the alpha warning has been logged yet."""
+    _hooked: bool = False
+    """Whether the cattrs structure hooks have been registered yet."""
 
     def __init__(self, intents: Intents = Intents.NON_PRIVILEGED):
+        if not Bot._alpha_warned:
+            logger.warning(
+                "retux is in alpha. If you come across a bug, please file a GitHub Issue."
+            )
+            Bot._alpha_warned = True
+
         self.intents = intents
         self._gateway = MISSING
         self.http = MISSING
+        self._calls = defaultdict(list)
 
-        cattrs_structure_hooks()
+        if not Bot._hooked:
+            cattrs_structure_hooks()
+            Bot._hooked = True
 
     def start(self, token: str):
         """
@@ -103,15 +118,14 @@ class Bot:
             Whether the coroutine is a Gateway event or not.
             Defaults to `True`.
         """
-        _name = name or coro.__name__
+        # Names are lowered here so every way of registering keys callbacks the
+        # same way, and interned since they're looked up on every dispatch.
+        _name = intern((name or coro.__name__).lower())
 
         listener = Listener(callback=coro, name=_name)
 
-        logger.debug(f"Registering {_name}.")
-        call = self._calls.get(_name, [])
-        call.append(listener)
-
-        self._calls[_name] = call
+        logger.debug("Registering %s.", _name)
+        self._calls[_name].append(listener)
 
         return listener
 
@@ -124,9 +138,44 @@ class Bot:
         name : `str`
             The name associated with the callbacks.
         """
-        for event in self._calls.get(name, []):
+        listeners = self._calls.get(name)
+        if not listeners:
+            return
+
+        # Most names only have the one callback, which isn't worth a nursery.
+        if len(listeners) == 1:
+            await self._call(listeners[0], *args, **kwargs)
+            return
+
+        # Callbacks run alongside each other, so one waiting on a request
+        # doesn't hold up the rest.
+        async with open_nursery() as nursery:
+            for listener in listeners:
+                nursery.start_soon(partial(self._call, listener, *args, **kwargs))
+
+    async def _call(self, listener: Listener, /, *args, **kwargs):
+        """
+        Calls a listener's callback, logging any error it raises.
 
-            await event(*args, **kwargs)
+        ---
+
+        Errors are contained to the listener that raised them, so
+        a failing callback can't cancel the others registered
+        under the same name, however many there are.
+
+        ---
+
+        Parameters
+        ----------
+        listener : `Listener`
+            The listener to call.
+        """
+        # Listeners only forward to their callback, so it's called directly
+        # rather than going through another frame to repack the arguments.
+        try:
+            await listener.callback(*args, **kwargs)
+        except Exception:
+            logger.exception("Ignoring exception in the %s callback.", listener.name)
 
     @overload  # No parenthesis
     def on(self, coro: Coro) -> Listener:
@@ -231,24 +280,16 @@ class Bot:
             The coroutine associated with the event, with
             a callable pattern as to `coro`.
         """
-        if isinstance(coro, Event):
+        # Event classes are instances of their metaclass, not of `Event`.
+        if isinstance(coro, EventMeta):
             if name is not MISSING:
                 coro.event_type = name
             return coro._register_events(self)
-
-        def decor(coro: Coro) -> Listener:
-            if isinstance(coro, Event):
-                if name is not MISSING:
-                    coro.event_type = name
-                return coro._register_events(self)
-            return self._register(
-                coro, name=name.lower() if name is not MISSING else coro.__name__.lower()
-            )
-
-        if isinstance(coro, str):
-            name = coro
-            return decor
-        return decor if coro is MISSING else decor(coro)
+        if type(coro) is str:
+            return partial(self.on, name=coro)
+        if coro is MISSING:
+            return partial(self.on, name=name)
+        return self._register(coro, name=None if name is MISSING else name)
 
     @property
     def latency(self) -> float:
@@ -1,14 +1,11 @@
-from typing import Callable, Any
+from typing import Callable
 
-from attr import define, field
+from attr import define
 
 
-@define(kw_only=True)
+@define(kw_only=True, eq=False)
 class Callback:
     callback: Callable
-    _obj: Any = field(default=None, init=False)  # set later as needed
 
     def __call__(self, *args, **kwargs):
-        if self._obj is not None:
-            return self.callback(self._obj, *args, **kwargs)
         return self.callback(*args, **kwargs)
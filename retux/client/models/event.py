@@ -1,43 +1,66 @@
-import inspect
-from typing import Callable, TYPE_CHECKING
+from typing import TYPE_CHECKING
+from weakref import WeakKeyDictionary
 
 if TYPE_CHECKING:
     from ..bot import Bot
+    from .listener import Listener
+
+_EVENT_HANDLER_NAMES = frozenset(
+    ("create", "add", "update", "delete", "remove", "remove_all", "delete_bulk")
+)
 
 
 class EventMeta(type):
     def __new__(cls, name: str, bases, dct, event_type=None):
         if event_type is None:
-            event_type = dct.pop("event_type") if "event_type" in dct else name.lower()
-        res = super(EventMeta, cls).__new__(cls, name, bases, dct)
+            event_type = dct.pop("event_type", None) or name.lower()
+        res = super().__new__(cls, name, bases, dct)
 
         res.event_type = event_type
 
+        # Handlers are known once the class body has run, so they're collected
+        # here instead of searching every attribute of the class on registration.
+        handlers = {
+            key for key, value in dct.items() if key in _EVENT_HANDLER_NAMES and callable(value)
+        }
+        for base in bases:
+            handlers.update(getattr(base, "_event_handlers", ()))
+        res._event_handlers = tuple(handlers)
+        res._listeners = WeakKeyDictionary()
+
         return res
 
 
 class Event(metaclass=EventMeta):
+    _listeners: WeakKeyDictionary["Bot", list["Listener"]]
+    """
+    The listeners registered from the event, by the bot they were registered to.
+    Bots are held weakly, so one that's gone doesn't stay alive through its events.
+    """
+
     @classmethod
     def _register_events(cls, bot: "Bot"):
         """Registers listeners from the event"""
         self = cls()
-        event_types = ("create", "add", "update", "delete", "remove", "remove_all", "delete_bulk")
+        listeners = cls._listeners.setdefault(bot, [])
 
-        for _, func in inspect.getmembers(self, predicate=inspect.ismethod):
-            func: Callable
-
-            if func.__name__ in event_types:
-                # override the name
-                name = f"{self.event_type}_{func.__name__}"
-                bot._register(coro=func, name=name)
+        for name in cls._event_handlers:
+            # override the name
+            listeners.append(
+                bot._register(coro=getattr(self, name), name=f"{self.event_type}_{name}")
+            )
 
         return cls
 
     @classmethod
     def _remove_events(cls, bot: "Bot"):
-        """Removes all listeners made from this event"""
-        for listeners in bot._calls.values():
-            for listener in listeners.copy():
-                if owner := getattr(listener.callback, "__self__", None):
-                    if isinstance(owner, cls):
-                        listeners.remove(listener)
+        """Removes all listeners made from this event and its subclasses"""
+        # Listeners are recorded on the class that registered them, so any
+        # subclasses registered to the bot have to be checked as well.
+        classes = [cls]
+        while classes:
+            klass = classes.pop()
+            classes.extend(klass.__subclasses__())
+
+            for listener in klass._listeners.pop(bot, ()):
+                bot._calls[listener.name].remove(listener)
@@ -5,7 +5,7 @@ from attr import define
 from .callback import Callback
 
 
-@define(kw_only=True)
+@define(kw_only=True, eq=False)
 class Listener(Callback):
     name: str
 
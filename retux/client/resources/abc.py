@@ -1,9 +1,8 @@
-import abc
+from typing import Protocol
 
 __all__ = ("Sendable",)
 
 
-class Sendable(abc.ABC):
-    @abc.abstractmethod
+class Sendable(Protocol):
     async def send(self, *everything, **else_):
         ...
@@ -1,5 +1,6 @@
 from datetime import datetime
 from enum import IntEnum, IntFlag
+from typing import ClassVar
 
 from attrs import define
 
@@ -552,8 +553,12 @@ class ThreadMember(Object):
     """
 
 
+_CHANNEL_TYPES: dict[int, type] = {}
+"""The channel classes `Channel` creates, by the channel type given."""
+
+
 # todo: fix the docstrings
-@define(kw_only=True)
+@define(kw_only=True, eq=False)
 class Channel(Partial, Object):
     """
     Represents a channel from Discord.
@@ -643,25 +648,18 @@ class Channel(Partial, Object):
             return object.__new__(cls)
 
         # some fun magic to get the right type if a plain Channel is created
-        match kwargs.get("type"):
-            case ChannelType.DM:
-                return object.__new__(DMChannel)
-            case ChannelType.GUILD_TEXT:
-                return object.__new__(GuildText)
-            case ChannelType.GUILD_VOICE:
-                return object.__new__(GuildVoice)
-            case ChannelType.GUILD_FORUM:
-                return object.__new__(ForumChannel)
-            case ChannelType.GUILD_NEWS:
-                return object.__new__(AnnouncementChannel)
-            case ChannelType.GUILD_STAGE_VOICE:
-                return object.__new__(StageChannel)
-            case ChannelType.GUILD_NEWS_THREAD | ChannelType.GUILD_PUBLIC_THREAD | ChannelType.GUILD_PRIVATE_THREAD:
-                return object.__new__(ThreadChannel)
-            case ChannelType.GUILD_CATEGORY:
-                return object.__new__(GuildChannel)
-            case _:
-                return object.__new__(Channel)
+        return object.__new__(_CHANNEL_TYPES.get(kwargs.get("type"), Channel))
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        # attrs recreates slotted classes, so this runs again for the final
+        # class and replaces what the original one registered.
+        for channel_type in cls.__dict__.get("_channel_types", ()):
+            _CHANNEL_TYPES[channel_type] = cls
+
+    _channel_types: ClassVar[tuple[ChannelType, ...]] = ()
+    """The channel types a plain `Channel` is created as this class for."""
 
     id: int
     """The ID of the channel."""
@@ -764,7 +762,7 @@ class Channel(Partial, Object):
     """Channel flags combined as a bitfield."""
 
 
-@define(kw_only=True)
+@define(kw_only=True, eq=False)
 class TextChannel(Channel):  # todo add sendable abc
     """
     Represents a text channel from Discord.
@@ -875,9 +873,12 @@ class TextChannel(Channel):  # todo add sendable abc
     """
 
 
+@define(kw_only=True, eq=False)
 class GuildChannel(Channel):
     """ """
 
+    _channel_types = (ChannelType.GUILD_CATEGORY,)
+
     name: str = None
     """
     The name of the channel.
@@ -905,9 +906,12 @@ class GuildChannel(Channel):
     """Explicit permission overwrites for members and roles."""
 
 
+@define(kw_only=True, eq=False)
 class GuildText(GuildChannel, TextChannel):
     """ """
 
+    _channel_types = (ChannelType.GUILD_TEXT,)
+
     topic: str = None
     """
     The topic of the channel.
@@ -928,7 +932,7 @@ class GuildText(GuildChannel, TextChannel):
     """
 
 
-@define(kw_only=True)
+@define(kw_only=True, eq=False)
 class AnnouncementChannel(GuildChannel):
     """
     Represents an announcement channel on Discord.
@@ -1008,8 +1012,10 @@ class AnnouncementChannel(GuildChannel):
         Channel flags combined as a bitfield.
     """
 
+    _channel_types = (ChannelType.GUILD_NEWS,)
 
-@define(kw_only=True)
+
+@define(kw_only=True, eq=False)
 class ForumChannel(GuildChannel):
     """
     Represents a forum channel on Discord.
@@ -1089,6 +1095,8 @@ class ForumChannel(GuildChannel):
         Channel flags combined as a bitfield.
     """
 
+    _channel_types = (ChannelType.GUILD_FORUM,)
+
     flags: ChannelFlags = None
     """Channel flags combined as a bitfield."""
 
@@ -1099,7 +1107,7 @@ class ForumChannel(GuildChannel):
     default_sort_order: int
 
 
-@define(kw_only=True)
+@define(kw_only=True, eq=False)
 class DMChannel(TextChannel):
     """
     Represents a DM channel on Discord.
@@ -1179,6 +1187,8 @@ class DMChannel(TextChannel):
         Channel flags combined as a bitfield.
     """
 
+    _channel_types = (ChannelType.DM,)
+
     recipients: list[User] = None
     """The recipients of the dm."""
     icon: str = None
@@ -1189,7 +1199,7 @@ class DMChannel(TextChannel):
     """The ID of the application that created the dm if it is bot-created."""
 
 
-@define(kw_only=True)
+@define(kw_only=True, eq=False)
 class ThreadChannel(GuildText):
     """
     Represents a thread channel from Discord.
@@ -1258,6 +1268,12 @@ class ThreadChannel(GuildText):
         Channel flags combined as a bitfield.
     """
 
+    _channel_types = (
+        ChannelType.GUILD_NEWS_THREAD,
+        ChannelType.GUILD_PUBLIC_THREAD,
+        ChannelType.GUILD_PRIVATE_THREAD,
+    )
+
     owner_id: int | None = None
     """The ID of the creator of the thread."""
     message_count: int | None = None
@@ -1294,9 +1310,12 @@ class ThreadChannel(GuildText):
     """
 
 
+@define(kw_only=True, eq=False)
 class GuildVoice(Channel):  # All voice things have to be in a guild, right?
     """ """
 
+    _channel_types = (ChannelType.GUILD_VOICE,)
+
     bitrate: int | None = None
     """The bitrate of the voice channel."""
     rtc_region: str = None
@@ -1305,7 +1324,7 @@ class GuildVoice(Channel):  # All voice things have to be in a guild, right?
     """The video quality mode of the voice channel."""
 
 
-@define(kw_only=True)
+@define(kw_only=True, eq=False)
 class VoiceChannel(GuildVoice):  # todo add sendable abc
     """
     Represents a voice channel from Discord.
@@ -1396,8 +1415,8 @@ class VoiceChannel(GuildVoice):  # todo add sendable abc
     """The user limit of the voice channel."""
 
 
-@define(kw_only=True)
-class StageChannel(Partial, Object):
+@define(kw_only=True, eq=False)
+class StageChannel(GuildVoice):
     """
     Represents a stage channel from Discord.
 
@@ -1445,8 +1464,10 @@ class StageChannel(Partial, Object):
         Channel flags combined as a bitfield.
     """
 
+    _channel_types = (ChannelType.GUILD_STAGE_VOICE,)
 
-@define(kw_only=True)
+
+@define(kw_only=True, weakref_slot=False)
 class _EmbedMedia:
     """
     Represents an embed thumbnail, video or image from Discord.
@@ -1479,7 +1500,7 @@ class _EmbedMedia:
     """The width of the media."""
 
 
-@define(kw_only=True)
+@define(kw_only=True, weakref_slot=False)
 class _EmbedProvider:
     """
     Represents the provider of an embed from Discord.
@@ -1498,7 +1519,7 @@ class _EmbedProvider:
     """The url of the provider."""
 
 
-@define(kw_only=True)
+@define(kw_only=True, weakref_slot=False)
 class _EmbedAuthor:
     """
     Represents the author of an embed from Discord.
@@ -1525,7 +1546,7 @@ class _EmbedAuthor:
     """The proxied URL of the author's icon."""
 
 
-@define(kw_only=True)
+@define(kw_only=True, weakref_slot=False)
 class _EmbedFooter:
     """
     Represents the footer of an embed from Discord.
@@ -1554,7 +1575,7 @@ class _EmbedFooter:
     """A proxied URL of the footer icon."""
 
 
-@define(kw_only=True)
+@define(kw_only=True, weakref_slot=False)
 class _EmbedField:
     """
     Represents a field of an embed from Discord.
@@ -1577,7 +1598,7 @@ class _EmbedField:
     """Whether or not the embed field is placed inline with other embed fields."""
 
 
-@define(kw_only=True, frozen=True)
+@define(kw_only=True, frozen=True, weakref_slot=False)
 class Embed:
     """
     Represnts a message embed from Discord.
@@ -1659,7 +1680,7 @@ class Embed:
     """The fields of the embed."""
 
 
-@define(kw_only=True)
+@define(kw_only=True, eq=False)
 class Attachment(Object):
     """
     Represents an attachment from Discord.
@@ -1746,7 +1767,7 @@ class Attachment(Object):
     """Whether or not the attachment is ephemeral."""
 
 
-@define(kw_only=True)
+@define(kw_only=True, eq=False)
 class Message(Object):
     """
     Represents a message from Discord.
@@ -183,6 +183,7 @@ class GuildScheduledEvent(Object):
     """The cover image hash of the scheduled event."""
 
 
+@define(kw_only=True)
 class GuildScheduledEventUser:
     """
     Represents a user in a guild scheduled event from Discord.
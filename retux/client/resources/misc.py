@@ -1,7 +1,7 @@
-from base64 import b64encode
 from datetime import datetime
 from enum import Enum
 from io import IOBase
+from mmap import ACCESS_READ, mmap
 from typing import Any
 
 from attr import field
@@ -9,6 +9,21 @@ from attrs import define
 
 from ...const import MISSING, NotNeeded
 
+try:
+    from ciso8601 import parse_datetime
+except ImportError:
+    parse_datetime = datetime.fromisoformat
+
+try:
+    from pybase64 import b64encode_as_string
+except ImportError:
+    from base64 import b64encode
+
+    def b64encode_as_string(s: Any) -> str:
+        # base64 output is always ASCII, which has the fastest decoder
+        return b64encode(s).decode("ascii")
+
+
 __all__ = (
     "ImageData",
     "Component",
@@ -20,6 +35,9 @@ __all__ = (
     "Object",
 )
 
+_IMAGE_TYPES = frozenset(("jpeg", "png", "gif"))
+"""The file types Discord accepts for image data."""
+
 
 @define(repr=False)
 class ImageData:
@@ -52,47 +70,62 @@ class ImageData:
 
     file: str
     """The name of the file, or path to the file if no `fp` is specified."""
-    fp: IOBase | bytes = MISSING
-    """The data of the file to be uploaded, either as bytes or io-object."""
+    fp: IOBase | bytes | bytearray | memoryview = MISSING
+    """The data of the file to be uploaded, either as a bytes-like or io-object."""
     _data: str = None
-    """The finalised and encrypted data that is sent to discord. Do not utilise as user."""
+    """
+    The finalised data-URI that is sent to discord, encoded on first access
+    of `data`. Do not utilise as user.
+    """
+    _type: str = field(default=None, init=False)
+    """The type of the image, taken from the file name on creation."""
 
     def __attrs_post_init__(self):
+        self._type = self.file.rpartition(".")[2]
 
-        if self.type not in {
-            "jpeg",
-            "png",
-            "gif",
-        }:
+        if self._type not in _IMAGE_TYPES:
             raise ValueError("File type must be one of jpeg, png or gif!")
 
-        if self.fp is not MISSING:
-            self.__data = (
-                b64encode(self.fp).decode("utf-8")
-                if isinstance(self.fp, bytes)
-                else b64encode(self.fp.read()).decode("utf-8")
-            )
-        else:
-            with open(self.file, "rb") as file:
-                self.__data = b64encode(file.read()).decode("utf-8")
+        # Streams may be closed by the time the data is needed, so they're read
+        # up front. Encoding is left until `data` is first accessed.
+        if self.fp is not MISSING and not isinstance(self.fp, (bytes, bytearray, memoryview)):
+            self.fp = self.fp.read()
 
     @property
     def data(self) -> str:
         """
         Returns the base64-encoded data-URI of the Image object.
         """
-        return f"data:image/{self.type};base64,{self._data}"
+        if self._data is None:
+            if self.fp is not MISSING:
+                encoded = b64encode_as_string(self.fp)
+            else:
+                with open(self.file, "rb") as file:
+                    # mapping the file lets it be encoded without first copying
+                    # all of it into a bytes object.
+                    try:
+                        mapped = mmap(file.fileno(), 0, access=ACCESS_READ)
+                    except (ValueError, OSError):
+                        # empty files and non-regular ones like pipes can't be mapped.
+                        encoded = b64encode_as_string(file.read())
+                    else:
+                        with mapped:
+                            encoded = b64encode_as_string(mapped)
+
+            self._data = f"data:image/{self.type};base64,{encoded}"
+
+        return self._data
 
     @property
     def name(self) -> str:
         """
         Returns the name of the image.
         """
-        return self._name.split("/")[-1].split(".")[0]
+        return self.file.rpartition("/")[2].partition(".")[0]
 
     @property
     def type(self) -> str:
-        return self.file.split(".")[-1]
+        return self._type
 
 
 class CDNEndpoint(Enum):
@@ -390,10 +423,9 @@ class Image:
         """The path to the image in CDN."""
         if not self._ids:
             raise RuntimeError("Tried to access image endpoint without needed ids.")
-        if "{hash}" in self._endpoint.value:
-            return self._endpoint.value.format(*self._ids, hash=self.hash)
-        else:
-            return self._endpoint.value.format(*self._ids)
+        # str.format ignores unused keyword arguments, so the hash can always be
+        # passed, even for endpoints that don't take one.
+        return self._endpoint.value.format(*self._ids, hash=self.hash)
 
     @property
     def url(self) -> str:
@@ -455,10 +487,9 @@ class Timestamp:
 
     Attributes
     ----------
-    _timestamp : `datetime`
+    timestamp : `datetime`
         The Python formatted date and time of the timestamp. This
-        is only used for internal reference. Please use the representation
-        of the class instead.
+        is parsed from Discord's ISO8601 string on first access.
 
     Methods
     -------
@@ -466,17 +497,30 @@ class Timestamp:
         Creates a mentionable format for the timestamp.
     """
 
-    _timestamp: str | datetime = field(converter=datetime.fromisoformat)
+    _timestamp: str | datetime
     """
-    The Python formatted date and time of the timestamp. This is only used for internal
-    reference. Please use the representation of the class instead.
+    The date and time of the timestamp as given, either as an ISO8601 string
+    or an already parsed `datetime`. Please use `timestamp` instead.
     """
+    _datetime: datetime | None = field(default=None, init=False)
+    """The parsed form of `_timestamp`, filled on first access."""
+
+    @property
+    def timestamp(self) -> datetime:
+        """The Python formatted date and time of the timestamp."""
+        if self._datetime is None:
+            self._datetime = (
+                parse_datetime(self._timestamp)
+                if isinstance(self._timestamp, str)
+                else self._timestamp
+            )
+        return self._datetime
 
     def __eq__(self, other: str | datetime) -> bool:
-        if type(other) == str:
-            return str(self._timestamp) == other
+        if isinstance(other, str):
+            return str(self.timestamp) == other
         else:
-            return self._timestamp == other
+            return self.timestamp == other
 
     def mention(self, style: NotNeeded[str | TimestampStyle] = MISSING) -> str:
         """
@@ -498,10 +542,10 @@ class Timestamp:
         else:
             _style = style if isinstance(style, str) else style.value
 
-        return f"<t:{self._timestamp}:{_style}>"
+        return f"<t:{int(self.timestamp.timestamp())}:{_style}>"
 
 
-@define()
+@define(eq=False)
 class Partial:
     """
     Represents partial information to a resource from Discord.
@@ -517,11 +561,20 @@ class Partial:
     """
 
 
-@define(kw_only=True)
+@define(kw_only=True, eq=False)
 class Object:
     """
     Represents the base object form of a resource from Discord.
 
+    ---
+
+    Subclasses declared with `eq=False`, such as channels, messages
+    and attachments, compare and hash by their ID against objects
+    of the same type. Every other subclass keeps the field-by-field
+    equality attrs generates for it, and is unhashable as a result.
+
+    ---
+
     Attributes
     ----------
     id : `int`
@@ -535,11 +588,25 @@ class Object:
     _extras: dict[str, Any] = field(init=False, factory=dict)
     """A dictionary of extra data sent from discord"""
 
+    def __eq__(self, other) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return self.id == other.id
+
+    def __hash__(self) -> int:
+        return hash(self.id)
+
     def __getattr__(self, item):
-        try:
-            return self._extras[item]
-        except KeyError:
-            raise AttributeError(f"'{self.__class__.__name__}' has no attribute '{item}'") from None
+        # this runs for every failed lookup, including hasattr() probes,
+        # so misses are checked without raising a KeyError first. Dunder
+        # probes from protocols like copy and pickle are never extras.
+        if item.startswith("__"):
+            raise AttributeError(f"'{self.__class__.__name__}' has no attribute '{item}'")
+
+        value = self._extras.get(item, MISSING)
+        if value is MISSING:
+            raise AttributeError(f"'{self.__class__.__name__}' has no attribute '{item}'")
+        return value
 
 
 @define()
@@ -1,4 +1,6 @@
-from attrs import asdict
+from typing import Any
+
+from attrs import Attribute, asdict
 
 from ...api.http import _Route, _RouteMethod
 
@@ -8,6 +10,21 @@ __all__ = (
     "Editable",
 )
 
+_EXCLUDED_FIELDS = frozenset(("_bot", "bot", "_bot_inst"))
+"""The names of fields that are never sent to Discord."""
+
+
+def _exclude_bot(attribute: Attribute, value: Any) -> bool:
+    return attribute.name not in _EXCLUDED_FIELDS
+
+
+def _payload(kwargs: dict) -> dict:
+    """Converts the given keyword arguments into a payload, turning any attrs instances into dictionaries."""
+    return {
+        key: asdict(value, filter=_exclude_bot) if hasattr(value, "__slots__") else value
+        for key, value in kwargs.items()
+    }
+
 
 class Editable:
     """
@@ -43,17 +60,7 @@ class Editable:
         """
 
         route = _Route(method=_RouteMethod.PATCH, path=path)
-        payload = {}
-        for key, value in kwargs.items():
-            if hasattr(value, "__slots__"):
-                payload[key] = asdict(
-                    value,
-                    filter=lambda _name, _value: _name.name not in {"_bot", "bot"},
-                )
-            else:
-                payload[key] = value
-
-        return await bot.http.request(route, payload)
+        return await bot.http.request(route, _payload(kwargs))
 
     async def modify(self, bot: "Bot", path: str, **kwargs) -> dict:  # noqa
         """An alias of the `edit()` method."""
@@ -111,18 +118,7 @@ class Respondable(Editable):
         """
 
         route = _Route(method=_RouteMethod.POST, path=path)
-
-        payload = {}
-        for key, value in kwargs.items():
-            if hasattr(value, "__slots__"):
-                payload[key] = asdict(
-                    value,
-                    filter=lambda _name, _value: _name.name not in {"_bot", "bot"},
-                )
-            else:
-                payload[key] = value
-
-        return await bot.http.request(route, payload)
+        return await bot.http.request(route, _payload(kwargs))
 
     async def send(self, bot: "Bot", path: str, **kwargs) -> dict:  # noqa
         """An alias of the `respond()` method."""
@@ -161,18 +157,7 @@ class Controllable:
             The data of the object returned by Discord.
         """
         route = _Route(method=_RouteMethod.POST, path=path)
-
-        payload = {}
-        for key, value in kwargs.items():
-            if hasattr(value, "__slots__"):
-                payload[key] = asdict(
-                    value,
-                    filter=lambda _name, _value: _name.name not in {"_bot", "bot"},
-                )
-            else:
-                payload[key] = value
-
-        return await bot.http.request(route, payload)
+        return await bot.http.request(route, _payload(kwargs))
 
     @classmethod
     async def get(cls, bot: "Bot", path: str, **query_params: dict | None) -> dict:  # noqa
@@ -1,6 +1,6 @@
 from enum import IntEnum
 
-from attrs import define
+from attrs import define, field
 
 from .misc import Object
 from .user import User
@@ -163,16 +163,19 @@ class Sticker(Object):
     Will only be availible if the sticker is
     part of a pack and owned by Discord.
     """
+    _clean_tags: list[str] | None = field(default=None, init=False, repr=False, eq=False)
+    """The split form of `tags`, filled on first access of `clean_tags`."""
 
     @property
-    async def clean_tags(self):
+    def clean_tags(self) -> list[str] | None:
         """
         A clean list of tags, formatted from the `tags` attribute.
 
         Only availible on standard stickers.
         """
-        if self.type == StickerType.STANDARD:
-            return self.tags.split(", ")
+        if self._clean_tags is None and self.type == StickerType.STANDARD:
+            self._clean_tags = self.tags.split(", ")
+        return self._clean_tags
 
 
 @define(kw_only=True)
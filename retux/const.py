@@ -19,17 +19,30 @@ __gateway_url__ = "wss://gateway.discord.gg/"
 __repo_url__ = "https://github.com/i0bs/retux"
 
 
-class MISSING:
+class _Missing:
     """
     A sentinel that represents an argument with a "missing" value.
     This is used deliberately to avoid `None` space confusion.
     """
 
-    pass
+    __slots__ = ()
 
+    def __repr__(self) -> str:
+        return "MISSING"
+
+    def __bool__(self) -> bool:
+        return False
+
+    def __reduce__(self) -> str:
+        # copies and pickles resolve back to the one instance
+        return "MISSING"
+
+
+MISSING = _Missing()
+"""The instance of the "missing" sentinel. Check for it with `is`."""
 
 _T = TypeVar("_T")
-NotNeeded = Union[_T, MISSING]
+NotNeeded = Union[_T, _Missing]
 """
 A type variable to work alongside `MISSING`. This should only
 be used to help further indicate an optional argument where it
@@ -1,7 +1,12 @@
+from enum import IntEnum, IntFlag
+from typing import Callable
+
 from attr import fields
 from cattrs import Converter, global_converter
-from cattrs.gen import make_dict_structure_fn
+from cattrs.gen import make_dict_structure_fn, override
 
+from ..api.events.guild import GuildCreate, GuildMembersChunk
+from ..api.events.misc import TypingStart
 from ..client.resources.misc import Object, Timestamp
 
 __all__ = "cattrs_structure_hooks"
@@ -11,29 +16,65 @@ def _pos_arg(data, type):
     return type(data)
 
 
-def store_extras(converter: Converter = global_converter):
+def _int_enum(data, type):
+    # Going through the enum's value map skips EnumMeta.__call__ for every
+    # known value, only falling back to it for unknown ones. Flags cache any
+    # combined value they create there, so repeated bitfields hit it too.
+    try:
+        return type._value2member_map_[data]
+    except KeyError:
+        return type(data)
+
+
+def store_extras(
+    converter: Converter = global_converter, *, debug_tracebacks: bool = False, **overrides
+):
     r"""
     A function that creates a structure factory when called with an optional converter
     The factory adds any extra attributes not present in the original fields into the class's `_extras` field.
+    Any keyword overrides are passed through to the generated structure function.
+    The generated source is only kept in `linecache` if `debug_tracebacks` is set.
     """
+    # cattrs drops its dispatch cache whenever a hook is registered, which would
+    # otherwise compile a new structure function for every class it sees again.
+    _cache: dict[type, Callable] = {}
 
     def make_structer(cls):
-        default_structure = make_dict_structure_fn(cls, converter)
-        names: set[str] = {field.name for field in fields(cls)}
+        if cls in _cache:
+            return _cache[cls]
+
+        # Don't default this back on. With _cattrs_use_linecache (cattrs 22.2,
+        # cattrs.gen._generate_unique_filename), every generated function is
+        # kept in linecache under "<cattrs generated structure module.Class>",
+        # probing "-2", "-3", ... suffixes until a free name is found. Each
+        # regeneration for a class therefore costs more than the last, and
+        # linecache grows for the life of the process.
+        default_structure = make_dict_structure_fn(
+            cls, converter, _cattrs_use_linecache=debug_tracebacks, **overrides
+        )
+        # Built once per class and shared by every structure call for it.
+        names = frozenset(
+            [field.name for field in fields(cls)]
+            + [o.rename for o in overrides.values() if o.rename is not None]
+        )
 
         def structure(data: dict[str, ...], _):
-            _extras = {key: data[key] for key in (data.keys() - names)}
-            # data["extras"] = _extras
             res = default_structure(data, _)
-            res._extras = _extras
+            # Most payloads only have known keys, and the instance already has
+            # its own empty _extras from the field factory in that case.
+            if not data.keys() <= names:
+                res._extras = {key: value for key, value in data.items() if key not in names}
             return res
 
+        _cache[cls] = structure
         return structure
 
     return make_structer
 
 
-def cattrs_structure_hooks(converter: Converter = global_converter):
+def cattrs_structure_hooks(
+    converter: Converter = global_converter, *, debug_tracebacks: bool = False
+):
     """
     Hooks retux objects into the cattrs converter.
     Can be used to hook objects into a user made
@@ -44,10 +85,45 @@ def cattrs_structure_hooks(converter: Converter = global_converter):
     converter : `Converter`, optional
         The converter to hook into, defaults to the
         global cattrs converter.
+    debug_tracebacks : `bool`, optional
+        Whether to keep the source of generated structure
+        functions in `linecache`, so tracebacks through them
+        show their code. Defaults to `False`.
     """
     # reg(Snowflake, _pos_arg)
     converter.register_structure_hook(Timestamp, _pos_arg)
+    converter.register_structure_hook_factory(
+        lambda cls: isinstance(cls, type) and issubclass(cls, (IntEnum, IntFlag)),
+        lambda _: _int_enum,
+    )
+    converter.register_structure_hook(
+        TypingStart,
+        make_dict_structure_fn(
+            TypingStart,
+            converter,
+            _cattrs_use_linecache=debug_tracebacks,
+            _timestamp=override(rename="timestamp"),
+        ),
+    )
+    converter.register_structure_hook(
+        GuildMembersChunk,
+        make_dict_structure_fn(
+            GuildMembersChunk,
+            converter,
+            _cattrs_use_linecache=debug_tracebacks,
+            _members=override(rename="members"),
+        ),
+    )
 
     converter.register_structure_hook_factory(
-        lambda cls: issubclass(cls, Object), store_extras(converter)
+        lambda cls: issubclass(cls, Object),
+        store_extras(converter, debug_tracebacks=debug_tracebacks),
+    )
+    converter.register_structure_hook_factory(
+        lambda cls: issubclass(cls, GuildCreate),
+        store_extras(
+            converter,
+            debug_tracebacks=debug_tracebacks,
+            _members=override(rename="members"),
+        ),
     )
@@ -32,6 +32,7 @@ setup(
     packages=find_packages(),
     include_package_data=True,
     install_requires=["attrs", "cattrs", "httpx", "trio", "trio_websocket"],
+    extras_require={"speedup": ["ciso8601", "orjson", "pybase64"]},
     python_requires=">=3.10.0",
     classifiers=[
         "Intended Audience :: Developers",